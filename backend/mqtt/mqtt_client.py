@@ -127,13 +127,15 @@ class MQTTClient:
             "tonypi/logs/+",     # Robot terminal logs
             "tonypi/emergency_stop/response"  # Emergency stop acknowledgements
         ]
+        # Robots publish command acknowledgements at QoS 1; telemetry is QoS 0
+        self.ack_topics = {"tonypi/commands/response", "tonypi/emergency_stop/response"}
 
     def on_connect(self, client, userdata, flags, rc):
         if rc == 0:
             print("MQTT: Connected to broker")
             # Subscribe to all topics
             for topic in self.topics:
-                client.subscribe(topic)
+                client.subscribe(topic, qos=1 if topic in self.ack_topics else 0)
                 print(f"MQTT: Subscribed to {topic}")
         else:
             print(f"MQTT: Failed to connect, return code {rc}")
@@ -176,6 +178,38 @@ class MQTTClient:
         # Extract robot_id from topic (tonypi/sensors/{robot_id})
         robot_id_from_topic = topic.split('/')[-1]
         
+        # Batched format: one message carrying every sensor of a cycle as
+        # {"readings": {sensor_type: value}}, with units taken from
+        # SENSOR_TYPES, or {"readings": {sensor_type: {"value": ..., "unit": ...}}}
+        readings = payload.get("readings")
+        if isinstance(readings, dict):
+            robot_id = payload.get("robot_id", robot_id_from_topic)
+            timestamp = payload.get("timestamp")
+            written = 0
+            for sensor_type, reading in readings.items():
+                if isinstance(reading, dict):
+                    value, unit = reading.get("value"), reading.get("unit")
+                else:
+                    value, unit = reading, None
+                # A malformed entry is skipped without dropping the rest
+                if not isinstance(value, (int, float)):
+                    if value is not None:
+                        print(f"MQTT: Skipping malformed {sensor_type} reading from {robot_id}: {reading!r}")
+                    continue
+                try:
+                    if influx_client.write_validated_sensor(
+                        robot_id=robot_id,
+                        sensor_type=sensor_type,
+                        value=value,
+                        timestamp=timestamp,
+                        unit=unit if isinstance(unit, str) else None
+                    ):
+                        written += 1
+                except Exception as e:
+                    print(f"MQTT: Error storing {sensor_type} reading from {robot_id}: {e}")
+            print(f"MQTT: Stored {written}/{len(readings)} sensor readings from {robot_id}")
+            return
+        
         # Get sensor_type from payload (the actual sensor type like "accelerometer_x")
         sensor_type = payload.get("sensor_type", "unknown")
         robot_id = payload.get("robot_id", robot_id_from_topic)
@@ -358,7 +358,7 @@ async def get_expected_data_format():
     """
     return {
         "mqtt_topics": {
-            "sensors": "tonypi/sensors/{sensor_type}",
+            "sensors": "tonypi/sensors/{robot_id}",
             "status": "tonypi/status/{robot_id}",
             "location": "tonypi/location",
             "battery": "tonypi/battery",
@@ -366,11 +366,19 @@ async def get_expected_data_format():
             "job": "tonypi/job/{robot_id}"
         },
         "sensor_data_format": {
-            "robot_id": "string (required)",
+            "robot_id": "string (optional, defaults to the last topic segment)",
+            "sensor_type": "string, e.g. 'accelerometer_x'",
             "timestamp": "ISO 8601 datetime (optional, auto-generated if missing)",
             "value": "number",
             "unit": "string (optional)"
         },
+        "sensor_batch_format": {
+            "robot_id": "string (optional, defaults to the last topic segment)",
+            "timestamp": "ISO 8601 datetime shared by all readings (optional)",
+            "readings": "object: {sensor_type: number} or {sensor_type: {value: number, unit: string}}; "
+                        "unit defaults to the known unit for that sensor type, "
+                        "and malformed entries are skipped without dropping the rest"
+        },
         "status_data_format": {
             "robot_id": "string (required)",
             "status": "string: online|offline|idle|busy",
@@ -393,6 +401,18 @@ async def get_expected_data_format():
             "success": "boolean: whether task succeeded (on completion)",
             "cancel_reason": "string: reason for cancellation (if cancelled)"
         },
+        "example_sensor_batch": {
+            "topic": "tonypi/sensors/tonypi_01",
+            "payload": {
+                "robot_id": "tonypi_01",
+                "readings": {
+                    "accelerometer_x": 0.12,
+                    "cpu_temperature": 52.3,
+                    "ultrasonic_distance": {"value": 34.5, "unit": "cm"}
+                },
+                "timestamp": "2025-01-01T12:00:00"
+            }
+        },
         "example_mqtt_publish": {
             "topic": "tonypi/status/tonypi_raspberrypi",
             "payload": {
@@ -202,6 +202,15 @@ class TestExpectedFormat:
         assert "status" in topics
         assert "battery" in topics
 
+    @pytest.mark.api
+    def test_expected_format_documents_sensor_batch(self, client: TestClient):
+        """Test that expected format documents the batched sensor readings payload."""
+        response = client.get("/api/v1/validate/expected-format")
+        data = response.json()
+        
+        assert "readings" in data["sensor_batch_format"]
+        assert "readings" in data["example_sensor_batch"]["payload"]
+
 
 class TestValidateAllRobots:
     """Tests for validate all robots endpoint."""
@@ -0,0 +1,109 @@
+"""
+Tests for MQTT sensor data ingestion (batched readings format).
+
+Run with: pytest tests/test_mqtt_sensor_ingest.py -v
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+
+
+class TestBatchedSensorIngest:
+    """Tests for handle_sensor_data with the batched "readings" payload."""
+
+    TOPIC = "tonypi/sensors/tonypi_01"
+
+    def _written(self, mock_influx):
+        """Map sensor_type -> write_validated_sensor kwargs for each write."""
+        return {
+            call.kwargs["sensor_type"]: call.kwargs
+            for call in mock_influx.write_validated_sensor.call_args_list
+        }
+
+    @pytest.mark.unit
+    @patch("mqtt.mqtt_client.influx_client")
+    def test_bare_value_readings(self, mock_influx):
+        """Test that bare numeric readings are written without a unit."""
+        from mqtt.mqtt_client import mqtt_client
+
+        mqtt_client.handle_sensor_data(self.TOPIC, {
+            "readings": {"accelerometer_x": 0.12, "cpu_temperature": 52.3},
+            "timestamp": "2025-01-01T12:00:00"
+        })
+
+        written = self._written(mock_influx)
+        assert set(written) == {"accelerometer_x", "cpu_temperature"}
+        assert written["accelerometer_x"]["value"] == 0.12
+        assert written["accelerometer_x"]["unit"] is None
+        assert written["cpu_temperature"]["timestamp"] == "2025-01-01T12:00:00"
+        # robot_id falls back to the last topic segment
+        assert written["cpu_temperature"]["robot_id"] == "tonypi_01"
+
+    @pytest.mark.unit
+    @patch("mqtt.mqtt_client.influx_client")
+    def test_value_unit_readings(self, mock_influx):
+        """Test that {value, unit} readings keep their explicit unit."""
+        from mqtt.mqtt_client import mqtt_client
+
+        mqtt_client.handle_sensor_data(self.TOPIC, {
+            "robot_id": "robot_a",
+            "readings": {"ultrasonic_distance": {"value": 34.5, "unit": "cm"}}
+        })
+
+        written = self._written(mock_influx)
+        assert written["ultrasonic_distance"]["value"] == 34.5
+        assert written["ultrasonic_distance"]["unit"] == "cm"
+        assert written["ultrasonic_distance"]["robot_id"] == "robot_a"
+
+    @pytest.mark.unit
+    def test_unit_falls_back_to_sensor_types(self):
+        """Test that a reading without a unit is stored with the SENSOR_TYPES unit."""
+        from mqtt.mqtt_client import mqtt_client
+        from database.influx_client import influx_client
+
+        with patch.object(influx_client, "write_sensor_data", return_value=True) as mock_write:
+            mqtt_client.handle_sensor_data(self.TOPIC, {
+                "readings": {"accelerometer_x": 0.12, "gyroscope_z": {"value": 1.5}}
+            })
+
+        fields = {
+            call.args[1]["sensor_type"]: call.args[2]
+            for call in mock_write.call_args_list
+        }
+        assert fields["accelerometer_x"]["unit"] == influx_client.SENSOR_TYPES["accelerometer_x"]["unit"]
+        assert fields["gyroscope_z"]["unit"] == influx_client.SENSOR_TYPES["gyroscope_z"]["unit"]
+        assert fields["gyroscope_z"]["value"] == 1.5
+
+    @pytest.mark.unit
+    @patch("mqtt.mqtt_client.influx_client")
+    def test_malformed_entry_does_not_abort_batch(self, mock_influx):
+        """Test that malformed readings are skipped and the rest are still written."""
+        from mqtt.mqtt_client import mqtt_client
+
+        mqtt_client.handle_sensor_data(self.TOPIC, {
+            "readings": {
+                "accelerometer_x": "not-a-number",
+                "accelerometer_y": {"unit": "m/s^2"},
+                "accelerometer_z": [1, 2, 3],
+                "cpu_temperature": 52.3,
+                "light_level": {"value": 80, "unit": "%"}
+            }
+        })
+
+        written = self._written(mock_influx)
+        assert set(written) == {"cpu_temperature", "light_level"}
+
+    @pytest.mark.unit
+    @patch("mqtt.mqtt_client.influx_client")
+    def test_write_error_does_not_abort_batch(self, mock_influx):
+        """Test that a failing write for one reading does not drop the others."""
+        from mqtt.mqtt_client import mqtt_client
+
+        mock_influx.write_validated_sensor = MagicMock(
+            side_effect=[Exception("write failed"), True]
+        )
+
+        mqtt_client.handle_sensor_data(self.TOPIC, {
+            "readings": {"accelerometer_x": 0.12, "cpu_temperature": 52.3}
+        })
+
+        assert mock_influx.write_validated_sensor.call_count == 2
@@ -28,6 +28,7 @@ METHODS:
         - get_bus_servo_temp(id)    - Get temperature (°C)
         - get_bus_servo_vin(id)     - Get voltage (mV)
         - get_bus_servo_deviation(id) - Get offset value
+        - get_bus_servo_status(id)  - Get (position, temp, voltage) together
     
     Setting Servo Position:
         - set_bus_servo_pulse(id, pulse, time) - Move bus servo
@@ -227,6 +228,40 @@ class Controller:
                 return None
             time.sleep(0.01)
 
+    def get_bus_servo_status(self, servo_id):
+        """
+        Get bus servo position, temperature and voltage in one pass.
+        
+        The three registers are requested back to back and only the ones
+        that failed are retried, sharing one retry budget instead of
+        running a separate retry loop per register.
+        
+        Args:
+            servo_id: Servo ID
+            
+        Returns:
+            tuple: (pulse, temperature in Celsius, voltage in millivolts);
+                   each entry is None if its read fails
+        """
+        readers = (
+            self.board.bus_servo_read_position,
+            self.board.bus_servo_read_temp,
+            self.board.bus_servo_read_vin,
+        )
+        values = [None, None, None]
+        pending = (0, 1, 2)
+        count = 0
+        while True:
+            for i in pending:
+                data = readers[i](servo_id)
+                if data is not None:
+                    values[i] = data[0]
+            pending = tuple(i for i in pending if values[i] is None)
+            count += 1
+            if not pending or count > self.time_out:
+                return tuple(values)
+            time.sleep(0.01)
+
     def get_bus_servo_deviation(self, servo_id):
         """
         Get bus servo deviation/offset.
@@ -27,16 +27,23 @@ if os.path.exists('/home/pi/TonyPi'):
 import asyncio
 import json
 import time
-import uuid
+import itertools
 import psutil
 import platform
 import random
 import socket
+import struct
 import threading
+import functools
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, Callable
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, Tuple
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from socketserver import ThreadingMixIn
+from urllib.parse import urlsplit, parse_qs
 import paho.mqtt.client as mqtt
 import logging
 
@@ -48,6 +55,32 @@ try:
 except ImportError:
     CV2_AVAILABLE = False
 
+# Try to import orjson for faster MQTT payload (de)serialization.
+# orjson.dumps returns bytes, which paho publishes without re-encoding.
+# OPT_SERIALIZE_NUMPY keeps numpy scalars working as they do with json.dumps.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = functools.partial(orjson.dumps, option=orjson.OPT_SERIALIZE_NUMPY)
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+    ORJSON_AVAILABLE = False
+
+# Try to import uvloop (libuv-based asyncio event loop) for main()
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# fcntl is POSIX-only; used for the interface address lookup
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -59,65 +92,204 @@ logger = logging.getLogger("TonyPi-Client")
 # MJPEG CAMERA STREAMING SERVER
 # ==========================================
 
-# Global frame storage for HTTP handler access
-_current_frame = None
-_frame_lock = threading.Lock()
+# Global frame storage for HTTP handler access. A one-slot deque: append and
+# indexed reads are single C calls, so the 30 Hz producer and the readers
+# exchange frames without taking a lock.
+_frame_slot = deque(maxlen=1)
+
+# Preallocated frame buffers update_frame() rotates through. A buffer whose
+# last published frame is still held by a reader (the frame slot, a cached
+# stream part or snapshot, or an encode in progress) is replaced rather than
+# overwritten, so published frames are never mutated.
+FRAME_BUFFER_COUNT = 3
+
+# Notified after each published frame so stream clients wake once per new frame
+_frame_cv = threading.Condition()
+
+# Default stream output: frames wider than this are downscaled before encoding
+DEFAULT_STREAM_WIDTH = 640
+DEFAULT_STREAM_QUALITY = 70
+# Output widths a client may request with ?w=; other values snap to the
+# nearest one, which bounds the per-size encode caches and resize buffers
+STREAM_WIDTHS = (160, 320, 480, 640, 800, 960, 1280, 1920)
+
+# Latest multipart stream part per (width, quality) as (source frame, part bytes),
+# shared by all stream clients using those settings
+_stream_parts: Dict[Tuple[int, int], Tuple[Any, bytes]] = {}
+# One encode lock per (width, quality), so only clients with the same settings
+# wait on each other
+_stream_key_locks: Dict[Tuple[int, int], threading.Lock] = {}
+# Guards the stream dicts; only held for lookups and updates, never an encode
+_stream_part_lock = threading.Lock()
+# Idle cv2.resize output buffers, keyed by output size (one per output width).
+# An encode takes its buffer out while using it and puts it back afterwards
+_resize_buffers: Dict[Tuple[int, int], Any] = {}
+# Latest full snapshot response as (source frame, response bytes). Its own
+# lock, so a full-resolution snapshot encode never holds up stream clients
+_snapshot_response = (None, None)
+_snapshot_lock = threading.Lock()
+
+# Snapshot response status line and headers; only Content-Length varies
+_SNAPSHOT_HEADER = (b'HTTP/1.0 200 OK\r\n'
+                    b'Content-Type: image/jpeg\r\n'
+                    b'Access-Control-Allow-Origin: *\r\n'
+                    b'Content-Length: %d\r\n\r\n')
+
+# Status page, pre-encoded around its two interpolation points
+_HTML_HEAD = """
+            <html>
+            <head><title>TonyPi Camera Stream</title></head>
+            <body style="font-family: Arial; background: #1a1a2e; color: white; padding: 20px;">
+                <h1>🤖 TonyPi Camera Stream</h1>
+                <p><b>Status:</b> """.encode()
+_HTML_MID = b"""</p>
+                <p><b>Frame shape:</b> """
+_HTML_TAIL = """</p>
+                <hr>
+                <p><a href="/?action=stream" style="color: #00ff88;">📹 MJPEG Stream</a></p>
+                <p><a href="/?action=snapshot" style="color: #00ff88;">📷 Snapshot</a></p>
+            </body>
+            </html>
+            """.encode()
+
+
+def _encode_stream_frame(frame, width: int = DEFAULT_STREAM_WIDTH,
+                         quality: int = DEFAULT_STREAM_QUALITY) -> bytes:
+    """
+    Return the complete multipart part (boundary, headers, JPEG, trailing
+    CRLF) for a published frame, encoding it only once per output setting.
+    
+    Frames wider than `width` are downscaled (aspect ratio kept) before
+    encoding, which cuts both encode time and bandwidth roughly with the
+    pixel count. update_frame() never writes into a buffer whose frame is
+    still referenced (this cache holds one), so the array identity tells
+    whether a cached part is current. Clients arriving while a frame
+    is being encoded with their settings wait for that encode instead of
+    starting their own; clients with other settings encode in parallel.
+    """
+    key = (width, quality)
+    with _stream_part_lock:
+        key_lock = _stream_key_locks.get(key)
+        if key_lock is None:
+            key_lock = _stream_key_locks[key] = threading.Lock()
+    with key_lock:
+        with _stream_part_lock:
+            cached_frame, part = _stream_parts.get(key, (None, None))
+        if cached_frame is frame:
+            return part
+        src = frame
+        height, frame_width = frame.shape[:2]
+        if 0 < width < frame_width:
+            size = (width, max(1, height * width // frame_width))
+            with _stream_part_lock:
+                dst = _resize_buffers.pop(size, None)
+                if dst is None:
+                    # Drop the buffer left over from a previous camera resolution
+                    for old in [s for s in _resize_buffers if s[0] == width]:
+                        del _resize_buffers[old]
+            src = cv2.resize(frame, size, dst=dst, interpolation=cv2.INTER_AREA)
+        _, jpeg = cv2.imencode('.jpg', src, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        part = (b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n%b\r\n'
+                % (len(jpeg), jpeg))
+        with _stream_part_lock:
+            if src is not frame:
+                _resize_buffers[size] = src
+            # Parts for older frames can never be served again
+            for stale in [k for k, (f, _) in _stream_parts.items() if f is not frame]:
+                del _stream_parts[stale]
+            _stream_parts[key] = (frame, part)
+        return part
+
+
+def _encode_snapshot(frame) -> bytes:
+    """
+    Return the complete snapshot HTTP response (headers and full-resolution
+    JPEG) for a published frame, encoding it only once however often
+    dashboards poll the snapshot URL.
+    """
+    global _snapshot_response
+    with _snapshot_lock:
+        cached_frame, response = _snapshot_response
+        if cached_frame is not frame:
+            _, jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
+            response = b''.join((_SNAPSHOT_HEADER % len(jpeg), jpeg))
+            _snapshot_response = (frame, response)
+        return response
+
+
+def _latest_frame():
+    """Return the most recently published frame, or None before the first one."""
+    try:
+        return _frame_slot[-1]
+    except IndexError:
+        return None
 
 
 class MJPEGHandler(BaseHTTPRequestHandler):
     """HTTP request handler for MJPEG streaming."""
     
+    # Kernel send buffer large enough to hold a whole frame without blocking
+    SEND_BUFFER_SIZE = 262144
+    
+    def setup(self):
+        """Disable Nagle and enlarge the send buffer for low-latency frames."""
+        super().setup()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.request.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER_SIZE)
+    
     def log_message(self, format, *args):
         """Suppress default logging."""
         pass
     
+    def _stream_settings(self) -> Tuple[int, int]:
+        """
+        Stream (width, quality): server defaults, overridable with ?w=320&q=50.
+        
+        Requested widths snap to the nearest of STREAM_WIDTHS.
+        """
+        width = self.server.stream_width
+        quality = self.server.stream_quality
+        query = parse_qs(urlsplit(self.path).query)
+        try:
+            if 'w' in query:
+                requested = int(query['w'][0])
+                width = min(STREAM_WIDTHS, key=lambda w: abs(w - requested))
+            if 'q' in query:
+                quality = min(95, max(10, int(query['q'][0])))
+        except ValueError:
+            pass
+        return width, quality
+    
     def do_GET(self):
         """Handle GET requests."""
-        global _current_frame
-        
         # Handle root/status request
         if self.path == '/' or self.path == '/test' or self.path == '/status':
+            # update_frame only ever publishes numpy arrays
+            frame = _latest_frame()
+            has_frame = frame is not None
+            frame_shape = frame.shape if has_frame else None
+            
+            status = b"OK - Receiving frames" if has_frame else b"Waiting for frames"
+            frame_info = str(frame_shape).encode() if frame_shape else b"None"
+            body = _HTML_HEAD + status + _HTML_MID + frame_info + _HTML_TAIL
+            
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
             self.send_header('Access-Control-Allow-Origin', '*')
             self.end_headers()
-            
-            with _frame_lock:
-                has_frame = _current_frame is not None
-                frame_shape = _current_frame.shape if has_frame and hasattr(_current_frame, 'shape') else None
-            
-            status = "OK - Receiving frames" if has_frame else "Waiting for frames"
-            frame_info = f"{frame_shape}" if frame_shape else "None"
-            
-            html = f"""
-            <html>
-            <head><title>TonyPi Camera Stream</title></head>
-            <body style="font-family: Arial; background: #1a1a2e; color: white; padding: 20px;">
-                <h1>🤖 TonyPi Camera Stream</h1>
-                <p><b>Status:</b> {status}</p>
-                <p><b>Frame shape:</b> {frame_info}</p>
-                <hr>
-                <p><a href="/?action=stream" style="color: #00ff88;">📹 MJPEG Stream</a></p>
-                <p><a href="/?action=snapshot" style="color: #00ff88;">📷 Snapshot</a></p>
-            </body>
-            </html>
-            """
-            self.wfile.write(html.encode())
+            self.wfile.write(body)
             return
         
         # Handle snapshot request
         if 'action=snapshot' in self.path:
-            with _frame_lock:
-                frame = _current_frame.copy() if _current_frame is not None else None
+            frame = _latest_frame()
             
             if frame is not None and CV2_AVAILABLE:
                 try:
-                    _, jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-                    self.send_response(200)
-                    self.send_header('Content-type', 'image/jpeg')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    self.wfile.write(jpeg.tobytes())
+                    # Headers and image in one write, without send_header's
+                    # per-line formatting and encoding
+                    self.wfile.write(_encode_snapshot(frame))
                 except Exception as e:
                     self.send_error(500, f"Error encoding frame: {e}")
             else:
@@ -132,21 +304,33 @@ class MJPEGHandler(BaseHTTPRequestHandler):
             self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
             self.end_headers()
             
-            logger.info(f'Camera stream started for {self.client_address[0]}')
+            width, quality = self._stream_settings()
+            logger.info(f'Camera stream started for {self.client_address[0]} (width={width}, quality={quality})')
+            
+            last_frame = None
             
+            def has_new_frame():
+                return _latest_frame() is not last_frame
+            
+            # Per-frame loop: bind the callables once instead of resolving
+            # attributes and building a predicate for every frame
+            latest_frame = _latest_frame
+            wait_for = _frame_cv.wait_for
+            encode = _encode_stream_frame
+            write = self.wfile.write
             while True:
                 try:
-                    with _frame_lock:
-                        frame = _current_frame.copy() if _current_frame is not None else None
-                    
-                    if frame is not None and CV2_AVAILABLE:
-                        _, jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
-                        self.wfile.write(b'--frame\r\n')
-                        self.wfile.write(b'Content-Type: image/jpeg\r\n\r\n')
-                        self.wfile.write(jpeg.tobytes())
-                        self.wfile.write(b'\r\n')
+                    # Block until the producer publishes a frame we have not sent
+                    with _frame_cv:
+                        wait_for(has_new_frame, timeout=1.0)
+                    frame = latest_frame()
+                    if frame is last_frame:
+                        continue  # Timed out without a new frame
+                    last_frame = frame
                     
-                    time.sleep(0.033)  # ~30 FPS
+                    if CV2_AVAILABLE:
+                        # One sendall per frame instead of four small writes
+                        write(encode(frame, width, quality))
                 except (BrokenPipeError, ConnectionResetError):
                     logger.info(f'Stream disconnected: {self.client_address[0]}')
                     break
@@ -165,6 +349,184 @@ class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
     """Handle requests in separate threads."""
     daemon_threads = True
     allow_reuse_address = True
+    stream_width = DEFAULT_STREAM_WIDTH
+    stream_quality = DEFAULT_STREAM_QUALITY
+
+
+# ==========================================
+# TIMESTAMP HELPERS
+# ==========================================
+
+# (10 ms tick, ISO string) of the last formatted timestamp
+_iso_cache = (0, "")
+
+
+def _iso_now() -> str:
+    """
+    Current local time as an ISO-8601 string, formatted at most once per
+    10 ms tick. Command responses and telemetry issued in the same tick share
+    the string instead of each building and formatting a datetime.
+    """
+    global _iso_cache
+    now = time.time()
+    tick = int(now * 100)
+    cached_tick, iso = _iso_cache
+    if tick != cached_tick:
+        iso = datetime.fromtimestamp(now).isoformat()
+        _iso_cache = (tick, iso)
+    return iso
+
+
+# ==========================================
+# SYSTEM METRIC HELPERS
+# ==========================================
+
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+
+# How long a get_system_info() snapshot is reused (seconds)
+SYSTEM_INFO_TTL = 1.0
+
+# How long read_sensors() / get_servo_status() results are reused (seconds)
+HARDWARE_READ_TTL = 0.2
+
+# How long the root filesystem usage figure is reused (seconds)
+DISK_USAGE_TTL = 60.0
+
+# (monotonic timestamp, percent) of the last disk usage read
+_disk_usage_cache = (0.0, None)
+
+
+@functools.lru_cache(maxsize=1)
+def _boot_time() -> float:
+    """Boot timestamp; constant for the lifetime of the process."""
+    return psutil.boot_time()
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_name() -> str:
+    """platform.platform() string; constant for the lifetime of the process."""
+    return platform.platform()
+
+
+def _disk_usage_percent(now: float) -> float:
+    """Root filesystem usage, re-read at most every DISK_USAGE_TTL seconds."""
+    global _disk_usage_cache
+    cached_at, percent = _disk_usage_cache
+    if percent is None or now - cached_at >= DISK_USAGE_TTL:
+        percent = psutil.disk_usage('/').percent
+        _disk_usage_cache = (now, percent)
+    return percent
+
+
+# ==========================================
+# BATTERY CURVE
+# ==========================================
+
+# Battery configuration for 3S LiPo
+BATTERY_MIN_V = 9.0    # 3.0V per cell - empty
+BATTERY_MAX_V = 12.6   # 4.2V per cell - full
+
+# Piecewise linear approximation of LiPo discharge curve as (voltage, percent).
+# These breakpoints are based on typical 3S LiPo discharge characteristics
+_BATTERY_CURVE = (
+    (9.0, 0),      # Empty
+    (9.6, 5),      # Critical low
+    (10.2, 15),    # Low
+    (10.5, 25),    # Start of nominal region
+    (10.8, 40),
+    (11.1, 50),    # Nominal voltage
+    (11.4, 65),
+    (11.7, 80),    # Good charge
+    (12.0, 90),
+    (12.3, 95),
+    (12.6, 100),   # Full
+)
+
+# Lookup table cells per volt (10 mV resolution)
+_BATTERY_LUT_SCALE = 100
+
+
+def _build_battery_lut() -> Tuple[float, ...]:
+    """
+    Sample the discharge curve every 10 mV from BATTERY_MIN_V to BATTERY_MAX_V.
+    
+    Every breakpoint lies on the 10 mV grid, so interpolating linearly between
+    adjacent cells reproduces the piecewise curve exactly.
+    """
+    cells = round((BATTERY_MAX_V - BATTERY_MIN_V) * _BATTERY_LUT_SCALE)
+    lut = []
+    segment = 0
+    for i in range(cells + 1):
+        voltage = BATTERY_MIN_V + i / _BATTERY_LUT_SCALE
+        while segment < len(_BATTERY_CURVE) - 2 and voltage > _BATTERY_CURVE[segment + 1][0] + 1e-9:
+            segment += 1
+        (v1, p1), (v2, p2) = _BATTERY_CURVE[segment], _BATTERY_CURVE[segment + 1]
+        lut.append(p1 + (voltage - v1) / (v2 - v1) * (p2 - p1))
+    return tuple(lut)
+
+
+_BATTERY_LUT = _build_battery_lut()
+
+
+# ==========================================
+# NETWORK HELPERS
+# ==========================================
+
+# Interfaces read, in order, when looking up the robot's address; others
+# (docker0, tun*, virbr*, ...) are not reachable by the dashboard and are
+# left to the routing-table fallback
+_PREFERRED_INTERFACES = ("wlan0", "eth0")
+_SIOCGIFADDR = 0x8915
+
+# How long a detected address is reused (seconds); long enough to keep the
+# lookup off every status tick, short enough to follow a DHCP/Wi-Fi change
+LOCAL_IP_TTL = 60.0
+
+
+def _interface_ip(ifname: str) -> Optional[str]:
+    """Read the IPv4 address of a network interface via SIOCGIFADDR (Linux)."""
+    if fcntl is None:
+        return None
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            packed = fcntl.ioctl(s.fileno(), _SIOCGIFADDR,
+                                 struct.pack('256s', ifname[:15].encode()))
+        return socket.inet_ntoa(packed[20:24])
+    except OSError:
+        return None
+
+
+def _detect_local_ip() -> str:
+    """
+    Determine the robot's LAN address.
+    
+    Reads the address straight from the preferred interfaces (no packets, no
+    routing lookups) and only falls back to the UDP-connect trick and the
+    hostname lookup when none of them has an IPv4 address.
+    """
+    for name in _PREFERRED_INTERFACES:
+        ip = _interface_ip(name)
+        if ip and not ip.startswith("127."):
+            return ip
+    
+    try:
+        # Create a socket to determine the local IP
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.connect(("8.8.8.8", 80))
+        ip = s.getsockname()[0]
+        s.close()
+        return ip
+    except Exception as e:
+        logger.warning(f"Could not determine local IP: {e}")
+        # Fallback: try to get from network interfaces
+        try:
+            hostname = socket.gethostname()
+            ip = socket.gethostbyname(hostname)
+            if ip != "127.0.0.1":
+                return ip
+        except:
+            pass
+        return "192.168.149.1"  # Default TonyPi IP
 
 
 # Try to import HiWonder SDK for real hardware access
@@ -205,12 +567,35 @@ except ImportError:
     logger.warning("RPi.GPIO not available - light sensor will be simulated")
 
 
+# Units reported alongside each sensor reading (read-only)
+_SENSOR_UNITS = MappingProxyType({
+    "accelerometer_x": "m/s^2",
+    "accelerometer_y": "m/s^2",
+    "accelerometer_z": "m/s^2",
+    "gyroscope_x": "deg/s",
+    "gyroscope_y": "deg/s",
+    "gyroscope_z": "deg/s",
+    "ultrasonic_distance": "cm",
+    "cpu_temperature": "C",
+    "light_sensor_dark": "bool",
+    "light_level": "%",
+    "light_status": "status"
+})
+
+
 class LightSensor:
     """Light sensor class for reading ambient light via GPIO."""
     
+    # Seconds a reading is reused; ambient light decisions do not need >4 Hz
+    READING_TTL = 0.25
+    
     def __init__(self, pin=24):
         self.pin = pin
         self.initialized = False
+        # Instance-local RNG for simulated readings
+        self._rng = random.Random()
+        # (monotonic timestamp, is_dark, light level) of the last reading
+        self._last_reading = (float("-inf"), False, 0)
         if LIGHT_SENSOR_AVAILABLE:
             try:
                 GPIO.setwarnings(False)
@@ -221,8 +606,8 @@ class LightSensor:
             except Exception as e:
                 logger.error(f"Failed to initialize light sensor: {e}")
     
-    def is_dark(self) -> bool:
-        """Returns True if sensor detects darkness (blocked/low light)."""
+    def _read_dark(self) -> bool:
+        """Sample the sensor (or the simulation) without caching."""
         if self.initialized and LIGHT_SENSOR_AVAILABLE:
             try:
                 return GPIO.input(self.pin) == 1
@@ -230,13 +615,26 @@ class LightSensor:
                 logger.error(f"Error reading light sensor: {e}")
                 return False
         # Simulation mode - randomly simulate light conditions
-        return random.random() < 0.1  # 10% chance of being dark
+        return self._rng.random() < 0.1  # 10% chance of being dark
+    
+    def _reading(self) -> Tuple[bool, int]:
+        """Return (is_dark, light level), resampling at most every READING_TTL."""
+        now = time.monotonic()
+        read_at, dark, level = self._last_reading
+        if now - read_at >= self.READING_TTL:
+            dark = self._read_dark()
+            # Low light when dark, normal/bright light otherwise
+            level = self._rng.randint(0, 20) if dark else self._rng.randint(60, 100)
+            self._last_reading = (now, dark, level)
+        return dark, level
+    
+    def is_dark(self) -> bool:
+        """Returns True if sensor detects darkness (blocked/low light)."""
+        return self._reading()[0]
     
     def get_light_level(self) -> int:
         """Returns light level: 0 = dark, 100 = bright."""
-        if self.is_dark():
-            return random.randint(0, 20)  # Low light
-        return random.randint(60, 100)  # Normal/bright light
+        return self._reading()[1]
     
     def cleanup(self):
         """Clean up GPIO resources."""
@@ -272,13 +670,85 @@ class TonyPiRobotClient:
     # Number of servos on the robot
     SERVO_COUNT = 6  # TonyPi has 6 main bus servos
     
+    # Telemetry scheduler step (seconds) and each channel's period in steps,
+    # in the order channels publish when due on the same step
+    TELEMETRY_TICK = 1.0
+    _TELEMETRY_SCHEDULE = (
+        (2, "_sensor_tick"),
+        (3, "_servo_tick"),
+        (30, "_battery_tick"),
+        (5, "_location_tick"),
+        (10, "_status_tick"),  # More frequent for Task Manager
+        (30, "_log_tick"),
+    )
+    
+    # Location and battery are only republished when they change (battery by
+    # at least BATTERY_PUBLISH_DELTA percent) or every TELEMETRY_HEARTBEAT s
+    TELEMETRY_HEARTBEAT = 60.0
+    BATTERY_PUBLISH_DELTA = 0.5
+    
+    # Change a sensor reading must show before it is republished; all
+    # readings are resent together every TELEMETRY_HEARTBEAT s
+    _SENSOR_DEADBANDS: Dict[str, float] = {
+        "accelerometer_x": 0.05,
+        "accelerometer_y": 0.05,
+        "accelerometer_z": 0.05,
+        "gyroscope_x": 0.5,
+        "gyroscope_y": 0.5,
+        "gyroscope_z": 0.5,
+        "ultrasonic_distance": 1.0,
+        "cpu_temperature": 0.5,
+        "light_level": 1.0,
+    }
+    
+    # Command acknowledgements (including emergency stop) are sent at QoS 1 so
+    # the dashboard learns the outcome; high-rate telemetry stays at QoS 0,
+    # where a lost sample is replaced by the next one
+    RESPONSE_QOS = 1
+    
+    # Initial broker connection attempts; failures back off exponentially
+    # (with jitter) up to RECONNECT_DELAY_MAX, the same cap as paho's reconnects
+    CONNECT_ATTEMPTS = 8
+    RECONNECT_DELAY_MAX = 30
+    
+    # Simulated battery drain in percent per second of wall time
+    SIM_BATTERY_DRAIN_PER_SEC = 0.01
+    
+    # Degrees per bus-servo pulse step around the 500 centre (90 / 500)
+    _DEGREES_PER_PULSE = 0.18
+    
+    # Display names reported by get_servo_status(), indexed by servo id - 1
+    _STATUS_SERVO_NAMES = ("Left Hip", "Left Knee", "Right Hip", "Right Knee", "Head Pan", "Head Tilt")
+    
+    # Commands still accepted while emergency stopped
+    _ESTOP_ALLOWED_COMMANDS = frozenset({"resume", "status_request", "battery_request"})
+    
+    # Simulated (dx, dy) per unit of distance for each move direction
+    _MOVE_DELTA: Dict[str, Tuple[float, float]] = {
+        "forward": (1.0, 0.0),
+        "backward": (-1.0, 0.0),
+        "left": (0.0, -1.0),
+        "right": (0.0, 1.0),
+    }
+    
+    # Head nod/shake PWM waypoints as (pulse, duration_ms)
+    _HEAD_GESTURE_STEPS: Tuple[Tuple[int, int], ...] = (
+        (1800, 200),
+        (1200, 200),
+        (1800, 200),
+        (1200, 200),
+        (1500, 100),
+    )
+    
     def __init__(
         self,
         mqtt_broker: str = "localhost",
         mqtt_port: int = 1883,
         robot_id: str = None,
         camera_port: int = 8081,
-        enable_camera_stream: bool = True
+        enable_camera_stream: bool = True,
+        stream_width: int = DEFAULT_STREAM_WIDTH,
+        stream_quality: int = DEFAULT_STREAM_QUALITY
     ):
         """
         Initialize the TonyPi Robot Client.
@@ -289,11 +759,16 @@ class TonyPiRobotClient:
             robot_id: Robot identifier (auto-generated if not provided)
             camera_port: HTTP port for MJPEG camera stream (default: 8081)
             enable_camera_stream: If True, starts camera streaming server
+            stream_width: Max MJPEG stream width; wider frames are downscaled
+                          before encoding (0 = native resolution)
+            stream_quality: MJPEG stream JPEG quality (1-100)
         """
         self.mqtt_broker = mqtt_broker
         self.mqtt_port = mqtt_port
         self.camera_port = camera_port
         self.enable_camera_stream = enable_camera_stream
+        self.stream_width = stream_width
+        self.stream_quality = stream_quality
         
         # Use hostname-based ID for persistence
         if robot_id:
@@ -302,7 +777,16 @@ class TonyPiRobotClient:
             hostname = platform.node().lower().replace(" ", "_")
             self.robot_id = f"tonypi_{hostname}"
         
-        self.client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=self.robot_id)
+        # Pre-encoded '{"robot_id":"...",' opening shared by every telemetry payload
+        self._robot_id_prefix = b'{"robot_id":' + json.dumps(self.robot_id).encode() + b','
+        
+        # Persistent session keyed by the stable robot_id: the broker keeps
+        # our subscriptions across reconnects. Subscriptions are QoS 0, so
+        # no stale commands are queued for us while we are away.
+        self.client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=self.robot_id,
+                                  clean_session=False)
+        # Back off paho's automatic reconnects instead of retrying every second
+        self.client.reconnect_delay_set(min_delay=1, max_delay=self.RECONNECT_DELAY_MAX)
         self.is_connected = False
         self.running = False
         
@@ -314,7 +798,19 @@ class TonyPiRobotClient:
         
         # Robot state
         self.battery_level = 100.0
-        self._last_battery_voltage = 12.6  # Store last read voltage for reporting
+        self._last_battery_voltage = None  # Last hardware voltage reading, for reporting
+        self._battery_sim_time = time.monotonic()  # Last simulated drain update
+        self._log_cycles = 0  # Periodic "running normally" log messages sent
+        
+        # (monotonic time, value) of the last location / battery publish
+        self._last_location_pub = (0.0, None)
+        self._last_battery_pub = (0.0, None)
+        # (monotonic time of the last full sensor batch, last published readings)
+        self._last_sensor_pub = (0.0, {})
+        
+        # Job progress counted from item info replies
+        self.items_done = 0
+        self.items_total = 10
         self.location = {"x": 0.0, "y": 0.0, "z": 0.0}
         self.sensors = {}
         self.status = "online"
@@ -327,10 +823,41 @@ class TonyPiRobotClient:
         # Emergency stop callback
         self.on_emergency_stop_callback: Optional[Callable] = None
         
+        # Single worker that plays timed servo sequences (head gestures) so
+        # the MQTT callback thread is not blocked by their sleeps
+        self._servo_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="servo")
+        # Set by an emergency stop to abort every gesture submitted before it;
+        # replaced with a fresh event for gestures submitted afterwards
+        self._gesture_cancel = threading.Event()
+        
+        # Hardware telemetry reads run on their own worker so slow bus
+        # transactions never stall the asyncio loop; _bus_lock serializes
+        # them against servo writes from the other threads
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telemetry")
+        self._bus_lock = threading.Lock()
+        
+        # System metrics: keep the thermal sysfs file open for pread(), cache
+        # get_system_info() for SYSTEM_INFO_TTL, and prime cpu_percent so the
+        # first non-blocking reading covers a real interval
+        self._thermal_fd = None
+        if hasattr(os, 'pread'):
+            try:
+                self._thermal_fd = os.open(THERMAL_ZONE_PATH, os.O_RDONLY)
+            except OSError:
+                pass
+        self._sysinfo_cache = (0.0, None)
+        self._ip_cache = (0.0, None)
+        self._sensor_cache = (0.0, None)
+        self._servo_cache = (0.0, None)
+        psutil.cpu_percent(interval=None)
+        
         # Camera streaming
         self._camera_server = None
         self._camera_thread = None
         self._ip_address = self.get_local_ip()
+        self._frame_buffers = []
+        self._frame_views = []  # Weak refs to the frame last published from each buffer
+        self._frame_write_idx = 0
         
         # MQTT Topics
         self.topics = {
@@ -350,10 +877,27 @@ class TonyPiRobotClient:
         self.scan_topic = f"tonypi/scan/{self.robot_id}"
         self.job_topic = f"tonypi/job/{self.robot_id}"
         
+        # Sequence for command ids generated when a sender omits one
+        self._cmd_seq = itertools.count(1)
+        
+        # Command type -> handler, looked up once per incoming command
+        self._cmd_handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "move": self.handle_move_command,
+            "resume": self._handle_resume_command,
+            "status_request": self.handle_status_request,
+            "battery_request": self.handle_battery_request,
+            "stop": self.handle_stop_command,
+            "shutdown": self.handle_shutdown_command,
+            "head_nod": self.handle_head_nod,
+            "head_shake": self.handle_head_shake,
+        }
+        
         # Setup MQTT callbacks
         self.client.on_connect = self.on_connect
         self.client.on_disconnect = self.on_disconnect
         self.client.on_message = self.on_message
+        # Item info replies are routed by paho straight to their own callback
+        self.client.message_callback_add(self.items_topic, self.on_item_message)
         
         logger.info(f"TonyPi Robot Client initialized with ID: {self.robot_id}")
         logger.info(f"Hardware available: {self.hardware_available}")
@@ -365,14 +909,16 @@ class TonyPiRobotClient:
             self.is_connected = True
             logger.info(f"Connected to MQTT broker at {self.mqtt_broker}:{self.mqtt_port}")
             
-            # Subscribe to command topics
-            client.subscribe(self.topics["commands"])
-            client.subscribe("tonypi/commands/broadcast")
-            client.subscribe(self.items_topic)
-            
-            # Subscribe to emergency stop topics
-            client.subscribe(f"tonypi/emergency_stop/{self.robot_id}")
-            client.subscribe("tonypi/emergency_stop/broadcast")
+            # A resumed session still holds our subscriptions
+            if not flags.session_present:
+                # Subscribe to command topics
+                client.subscribe(self.topics["commands"])
+                client.subscribe("tonypi/commands/broadcast")
+                client.subscribe(self.items_topic)
+                
+                # Subscribe to emergency stop topics
+                client.subscribe(f"tonypi/emergency_stop/{self.robot_id}")
+                client.subscribe("tonypi/emergency_stop/broadcast")
             
             # Send initial status
             self.send_status_update()
@@ -389,67 +935,79 @@ class TonyPiRobotClient:
         """Handle incoming MQTT messages (commands from monitoring system)."""
         try:
             topic = msg.topic
-            payload = json.loads(msg.payload.decode())
+            payload = _json_loads(msg.payload)
             
             logger.info(f"Received command on {topic}: {payload}")
             
             command_type = payload.get("type")
-            command_id = payload.get("id", str(uuid.uuid4()))
-            
-            response = {
-                "robot_id": self.robot_id,
-                "command_id": command_id,
-                "timestamp": datetime.now().isoformat(),
-                "success": False,
-                "message": "Unknown command"
-            }
+            # Assigned once here; handlers read it back via _command_id()
+            command_id = self._command_id(payload)
             
             # Handle emergency stop commands (separate topic)
             if topic.startswith("tonypi/emergency_stop/"):
                 response = self._handle_emergency_stop(payload)
                 # Send response to emergency stop response topic
-                self.client.publish("tonypi/emergency_stop/response", json.dumps(response))
+                self.client.publish("tonypi/emergency_stop/response", _json_dumps(response), qos=self.RESPONSE_QOS)
                 # Also send to regular command response for compatibility
-                self.client.publish(self.topics["response"], json.dumps(response))
+                self.client.publish(self.topics["response"], _json_dumps(response), qos=self.RESPONSE_QOS)
                 return
             
             # Check if emergency stopped - block most commands
-            if self.emergency_stopped and command_type not in ["resume", "status_request", "battery_request"]:
-                response["success"] = False
-                response["message"] = f"Robot is emergency stopped. Send 'resume' command first. Reason: {self.emergency_reason}"
-                self.client.publish(self.topics["response"], json.dumps(response))
+            if self.emergency_stopped and command_type not in self._ESTOP_ALLOWED_COMMANDS:
+                response = {
+                    "robot_id": self.robot_id,
+                    "command_id": command_id,
+                    "timestamp": _iso_now(),
+                    "success": False,
+                    "message": f"Robot is emergency stopped. Send 'resume' command first. Reason: {self.emergency_reason}"
+                }
+                self.client.publish(self.topics["response"], _json_dumps(response), qos=self.RESPONSE_QOS)
                 return
             
-            if command_type == "move":
-                response = self.handle_move_command(payload)
-            elif command_type == "resume":
-                response = self._handle_resume_command(payload)
-            elif command_type == "status_request":
-                response = self.handle_status_request(payload)
-            elif command_type == "battery_request":
-                response = self.handle_battery_request(payload)
-            elif command_type == "stop":
-                response = self.handle_stop_command(payload)
-            elif command_type == "shutdown":
-                response = self.handle_shutdown_command(payload)
-            elif command_type == "head_nod":
-                response = self.handle_head_nod(payload)
-            elif command_type == "head_shake":
-                response = self.handle_head_shake(payload)
-            elif topic.startswith("tonypi/items/"):
-                response = self._handle_item_info(payload)
+            handler = self._cmd_handlers.get(command_type)
+            if handler is not None:
+                response = handler(payload)
+            else:
+                response = {
+                    "robot_id": self.robot_id,
+                    "command_id": command_id,
+                    "timestamp": _iso_now(),
+                    "success": False,
+                    "message": "Unknown command"
+                }
             
             # Send response
-            self.client.publish(self.topics["response"], json.dumps(response))
+            self.client.publish(self.topics["response"], _json_dumps(response), qos=self.RESPONSE_QOS)
             
         except Exception as e:
             logger.error(f"Error handling message: {e}")
 
+    def on_item_message(self, client, userdata, msg):
+        """Handle item info replies on the items topic."""
+        try:
+            payload = _json_loads(msg.payload)
+            logger.info(f"Received item info on {msg.topic}: {payload}")
+            response = self._handle_item_info(payload)
+            self.client.publish(self.topics["response"], _json_dumps(response), qos=self.RESPONSE_QOS)
+        except Exception as e:
+            logger.error(f"Error handling item info: {e}")
+
+    def _command_id(self, payload: Dict) -> Any:
+        """
+        The sender's command id, or a locally generated '<robot_id>-<n>'.
+        
+        A generated id is stored on the payload, so every handler and later
+        lookup reports the same id for the command.
+        """
+        if "id" not in payload:
+            payload["id"] = f"{self.robot_id}-{next(self._cmd_seq)}"
+        return payload["id"]
+
     def _handle_item_info(self, payload):
         """Handle item info responses."""
         response = {
             "robot_id": self.robot_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "success": payload.get('found', False),
             "item": payload.get('item'),
             "message": payload.get('message', 'Item info')
@@ -457,21 +1015,19 @@ class TonyPiRobotClient:
         
         # Update job progress
         try:
-            if not hasattr(self, 'items_done'):
-                self.items_done = 0
-                self.items_total = 10
             if payload.get('found', False):
                 self.items_done += 1
-                percent = round((self.items_done / max(1, self.items_total)) * 100, 2)
+                # Whole percent in integer math; reaches 100 exactly when done
+                percent = (100 * self.items_done) // max(1, self.items_total)
                 job_event = {
                     "robot_id": self.robot_id,
                     "percent": percent,
                     "status": "working" if percent < 100 else "completed",
                     "items_done": self.items_done,
                     "items_total": self.items_total,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _iso_now()
                 }
-                self.client.publish(self.job_topic, json.dumps(job_event))
+                self.client.publish(self.job_topic, _json_dumps(job_event))
         except Exception as e:
             logger.error(f"Error updating job progress: {e}")
         
@@ -480,12 +1036,16 @@ class TonyPiRobotClient:
     def _handle_emergency_stop(self, payload: Dict) -> Dict:
         """Handle emergency stop command - immediately stop all motors."""
         reason = payload.get("reason", "Emergency stop triggered")
-        command_id = payload.get("id", str(uuid.uuid4()))
+        command_id = self._command_id(payload)
         
         # Set emergency stop state
         self.emergency_stopped = True
         self.emergency_reason = reason
         
+        # Abort the running head gesture and drop queued ones
+        self._gesture_cancel.set()
+        self._gesture_cancel = threading.Event()
+        
         # Stop all movement immediately
         if self.hardware_available:
             try:
@@ -507,7 +1067,7 @@ class TonyPiRobotClient:
             "robot_id": self.robot_id,
             "command_id": command_id,
             "type": "emergency_stop",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "success": True,
             "message": f"Emergency stop activated: {reason}",
             "reason": reason,
@@ -519,14 +1079,14 @@ class TonyPiRobotClient:
 
     def _handle_resume_command(self, payload: Dict) -> Dict:
         """Handle resume command - clear emergency stop state."""
-        command_id = payload.get("id", str(uuid.uuid4()))
+        command_id = self._command_id(payload)
         
         if not self.emergency_stopped:
             return {
                 "robot_id": self.robot_id,
                 "command_id": command_id,
                 "type": "resume",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_now(),
                 "success": True,
                 "message": "Robot was not in emergency stop state"
             }
@@ -543,7 +1103,7 @@ class TonyPiRobotClient:
             "robot_id": self.robot_id,
             "command_id": command_id,
             "type": "resume",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "success": True,
             "message": f"Robot resumed from emergency stop (was: {previous_reason})",
             "previous_reason": previous_reason,
@@ -553,6 +1113,16 @@ class TonyPiRobotClient:
             }
         }
 
+    def _base_response(self, payload: Dict[str, Any], success: bool, message: str) -> Dict[str, Any]:
+        """Fields common to every command response; handlers add their own."""
+        return {
+            "robot_id": self.robot_id,
+            "command_id": self._command_id(payload),
+            "timestamp": _iso_now(),
+            "success": success,
+            "message": message
+        }
+
     def handle_move_command(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle movement commands using TonyPi action groups."""
         try:
@@ -569,35 +1139,20 @@ class TonyPiRobotClient:
                     logger.warning(f"Movement command failed: {result.get('message')}")
             else:
                 # Simulate movement
-                if direction == "forward":
-                    self.location["x"] += distance
-                elif direction == "backward":
-                    self.location["x"] -= distance
-                elif direction == "left":
-                    self.location["y"] -= distance
-                elif direction == "right":
-                    self.location["y"] += distance
+                dx, dy = self._MOVE_DELTA.get(direction, (0.0, 0.0))
+                self.location["x"] += dx * distance
+                self.location["y"] += dy * distance
             
             # Simulate battery consumption
             self.battery_level = max(0, self.battery_level - (distance * 0.1))
             
-            return {
-                "robot_id": self.robot_id,
-                "command_id": payload.get("id"),
-                "timestamp": datetime.now().isoformat(),
-                "success": True,
-                "message": f"Moved {direction} for {distance} units",
-                "new_location": self.location.copy(),
-                "battery_level": self.battery_level
-            }
+            response = self._base_response(payload, True, f"Moved {direction} for {distance} units")
+            # Encoded right away on this thread, which is the only writer
+            response["new_location"] = self.location
+            response["battery_level"] = self.battery_level
+            return response
         except Exception as e:
-            return {
-                "robot_id": self.robot_id,
-                "command_id": payload.get("id"),
-                "timestamp": datetime.now().isoformat(),
-                "success": False,
-                "message": f"Movement failed: {str(e)}"
-            }
+            return self._base_response(payload, False, f"Movement failed: {str(e)}")
 
     def handle_stop_command(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle stop command."""
@@ -609,166 +1164,142 @@ class TonyPiRobotClient:
             except Exception as e:
                 logger.error(f"Error stopping actions: {e}")
         
-        return {
-            "robot_id": self.robot_id,
-            "command_id": payload.get("id"),
-            "timestamp": datetime.now().isoformat(),
-            "success": True,
-            "message": "Robot stopped successfully"
-        }
+        return self._base_response(payload, True, "Robot stopped successfully")
+
+    def _run_head_gesture(self, servo_id: int, gesture: str, cancel: threading.Event):
+        """
+        Play the head gesture waypoints on a PWM servo (servo worker thread).
+        
+        Stops before the next waypoint, or mid-wait, once `cancel` is set.
+        """
+        try:
+            for pulse, duration_ms in self._HEAD_GESTURE_STEPS:
+                if cancel.is_set():
+                    logger.info(f"Head {gesture} aborted by emergency stop")
+                    return
+                with self._bus_lock:
+                    controller.set_pwm_servo_pulse(servo_id, pulse, duration_ms)
+                cancel.wait(duration_ms / 1000.0)
+        except Exception as e:
+            logger.error(f"Error during head {gesture}: {e}")
 
     def handle_head_nod(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle head nod command."""
+        """Handle head nod command (the motion runs on the servo worker)."""
         logger.info("Nodding head")
         
         if self.hardware_available and controller:
+            # PWM servo 1 controls head tilt
             try:
-                # PWM servo 1 controls head tilt
-                controller.set_pwm_servo_pulse(1, 1800, 200)
-                time.sleep(0.2)
-                controller.set_pwm_servo_pulse(1, 1200, 200)
-                time.sleep(0.2)
-                controller.set_pwm_servo_pulse(1, 1800, 200)
-                time.sleep(0.2)
-                controller.set_pwm_servo_pulse(1, 1200, 200)
-                time.sleep(0.2)
-                controller.set_pwm_servo_pulse(1, 1500, 100)
-            except Exception as e:
-                logger.error(f"Error nodding head: {e}")
+                self._servo_worker.submit(self._run_head_gesture, 1, "nod", self._gesture_cancel)
+            except RuntimeError:
+                # Servo worker already shut down by disconnect()
+                return self._base_response(payload, False, "Head nod rejected: robot client is shutting down")
         
-        return {
-            "robot_id": self.robot_id,
-            "command_id": payload.get("id"),
-            "timestamp": datetime.now().isoformat(),
-            "success": True,
-            "message": "Head nod completed"
-        }
+        return self._base_response(payload, True, "Head nod started")
 
     def handle_head_shake(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle head shake command."""
+        """Handle head shake command (the motion runs on the servo worker)."""
         logger.info("Shaking head")
         
         if self.hardware_available and controller:
+            # PWM servo 2 controls head pan
             try:
-                # PWM servo 2 controls head pan
-                controller.set_pwm_servo_pulse(2, 1800, 200)
-                time.sleep(0.2)
-                controller.set_pwm_servo_pulse(2, 1200, 200)
-                time.sleep(0.2)
-                controller.set_pwm_servo_pulse(2, 1800, 200)
-                time.sleep(0.2)
-                controller.set_pwm_servo_pulse(2, 1200, 200)
-                time.sleep(0.2)
-                controller.set_pwm_servo_pulse(2, 1500, 100)
-            except Exception as e:
-                logger.error(f"Error shaking head: {e}")
+                self._servo_worker.submit(self._run_head_gesture, 2, "shake", self._gesture_cancel)
+            except RuntimeError:
+                # Servo worker already shut down by disconnect()
+                return self._base_response(payload, False, "Head shake rejected: robot client is shutting down")
         
-        return {
-            "robot_id": self.robot_id,
-            "command_id": payload.get("id"),
-            "timestamp": datetime.now().isoformat(),
-            "success": True,
-            "message": "Head shake completed"
-        }
+        return self._base_response(payload, True, "Head shake started")
 
     def handle_status_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle status request commands."""
-        return {
-            "robot_id": self.robot_id,
-            "command_id": payload.get("id"),
-            "timestamp": datetime.now().isoformat(),
-            "success": True,
-            "message": "Status retrieved",
-            "data": {
-                "status": "emergency_stopped" if self.emergency_stopped else self.status,
-                "emergency_stopped": self.emergency_stopped,
-                "emergency_reason": self.emergency_reason,
-                "battery_level": self.get_battery_percentage(),
-                "location": self.location.copy(),
-                "sensors": self.sensors.copy(),
-                "system_info": self.get_system_info(),
-                "hardware_available": self.hardware_available
-            }
+        response = self._base_response(payload, True, "Status retrieved")
+        response["data"] = {
+            "status": "emergency_stopped" if self.emergency_stopped else self.status,
+            "emergency_stopped": self.emergency_stopped,
+            "emergency_reason": self.emergency_reason,
+            "battery_level": self.get_battery_percentage(),
+            # No copies: the response is encoded immediately on the MQTT
+            # thread (the only writer of location), and read_sensors()
+            # replaces self.sensors rather than mutating it
+            "location": self.location,
+            "sensors": self.sensors,
+            "system_info": self.get_system_info(),
+            "hardware_available": self.hardware_available
         }
+        return response
 
     def handle_battery_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle battery status request."""
         battery = self.get_battery_percentage()
-        return {
-            "robot_id": self.robot_id,
-            "command_id": payload.get("id"),
-            "timestamp": datetime.now().isoformat(),
-            "success": True,
-            "message": "Battery status retrieved",
-            "data": {
-                "battery_level": battery,
-                "charging": False,
-                "estimated_time": battery * 2
-            }
+        response = self._base_response(payload, True, "Battery status retrieved")
+        response["data"] = {
+            "battery_level": battery,
+            "charging": False,
+            "estimated_time": battery * 2
         }
+        return response
 
     def handle_shutdown_command(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle shutdown command."""
         logger.info("Shutting down robot client")
         self.running = False
-        return {
-            "robot_id": self.robot_id,
-            "command_id": payload.get("id"),
-            "timestamp": datetime.now().isoformat(),
-            "success": True,
-            "message": "Robot shutting down"
-        }
+        return self._base_response(payload, True, "Robot shutting down")
 
     def get_system_info(self) -> Dict[str, Any]:
-        """Get system information from Raspberry Pi (Task Manager metrics)."""
+        """
+        Get system information from Raspberry Pi (Task Manager metrics).
+        
+        The snapshot is cached for SYSTEM_INFO_TTL seconds so back-to-back
+        status requests and status updates share one set of /proc reads.
+        """
+        cached_at, info = self._sysinfo_cache
+        now = time.monotonic()
+        if info is not None and now - cached_at < SYSTEM_INFO_TTL:
+            return info
+        
         try:
             cpu_temp = self.get_cpu_temperature()
             # Use interval=None to get instant reading (non-blocking)
             # This returns the CPU usage since last call
             cpu_percent = psutil.cpu_percent(interval=None)
-            return {
-                "platform": platform.platform(),
+            info = {
+                "platform": _platform_name(),
                 "cpu_percent": cpu_percent,
                 "memory_percent": psutil.virtual_memory().percent,
-                "disk_usage": psutil.disk_usage('/').percent,
+                "disk_usage": _disk_usage_percent(now),
                 "temperature": cpu_temp,           # Legacy field
                 "cpu_temperature": cpu_temp,       # New field for frontend
-                "uptime": time.time() - psutil.boot_time(),
+                "uptime": time.time() - _boot_time(),
                 "hardware_mode": self.hardware_available,
                 "hardware_sdk": self.hardware_available
             }
         except Exception as e:
             logger.error(f"Error getting system info: {e}")
             return {"error": str(e)}
+        
+        self._sysinfo_cache = (now, info)
+        return info
 
     def get_cpu_temperature(self) -> float:
         """Get CPU temperature (Raspberry Pi specific)."""
-        try:
-            with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                return float(f.read()) / 1000.0
-        except:
-            return 45.0 + (time.time() % 10)
-
-    def get_local_ip(self) -> str:
-        """Get the local IP address of the robot."""
-        try:
-            # Create a socket to determine the local IP
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except Exception as e:
-            logger.warning(f"Could not determine local IP: {e}")
-            # Fallback: try to get from network interfaces
+        if self._thermal_fd is not None:
             try:
-                hostname = socket.gethostname()
-                ip = socket.gethostbyname(hostname)
-                if ip != "127.0.0.1":
-                    return ip
-            except:
+                # pread at offset 0 re-reads the sysfs value without
+                # reopening the file or seeking
+                return float(os.pread(self._thermal_fd, 16, 0)) / 1000.0
+            except (OSError, ValueError):
                 pass
-            return "192.168.149.1"  # Default TonyPi IP
+        return 45.0 + (time.time() % 10)
+
+    def get_local_ip(self) -> str:
+        """Get the local IP address of the robot (cached for LOCAL_IP_TTL)."""
+        now = time.monotonic()
+        checked_at, ip = self._ip_cache
+        if ip is None or now - checked_at >= LOCAL_IP_TTL:
+            ip = _detect_local_ip()
+            self._ip_cache = (now, ip)
+        return ip
 
     def get_battery_percentage(self) -> float:
         """
@@ -786,6 +1317,9 @@ class TonyPiRobotClient:
         """
         if self.hardware_available and board:
             try:
+                # Pops the latest value the SDK's receive thread queued; it
+                # never touches the bus, so no _bus_lock (command handlers
+                # call this on the MQTT thread)
                 voltage_mv = board.get_battery()
                 if voltage_mv:
                     voltage_v = voltage_mv / 1000.0
@@ -796,6 +1330,14 @@ class TonyPiRobotClient:
             except Exception as e:
                 logger.error(f"Error reading battery: {e}")
         
+        if not self.hardware_available:
+            # Simulate drain from elapsed time, independent of how often
+            # the level is polled
+            now = time.monotonic()
+            drain = self.SIM_BATTERY_DRAIN_PER_SEC * (now - self._battery_sim_time)
+            self._battery_sim_time = now
+            self.battery_level = max(0, self.battery_level - drain)
+        
         return self.battery_level
     
     def _voltage_to_percentage(self, voltage: float) -> float:
@@ -805,6 +1347,8 @@ class TonyPiRobotClient:
         For 3S LiPo (9.0V - 12.6V range):
         - Uses piecewise linear approximation of actual discharge curve
         - More accurate than simple linear mapping
+        - Evaluated from a 10 mV lookup table (_BATTERY_LUT): one clamped
+          index and one interpolation, no per-segment search
         
         Args:
             voltage: Battery voltage in Volts
@@ -812,49 +1356,31 @@ class TonyPiRobotClient:
         Returns:
             Battery percentage (0-100)
         """
-        # Battery configuration for 3S LiPo
-        BATTERY_MIN_V = 9.0    # 3.0V per cell - empty
-        BATTERY_MAX_V = 12.6   # 4.2V per cell - full
-        
-        # Clamp voltage to valid range
+        # Clamp voltage to valid range, then locate its 10 mV cell
         voltage = max(BATTERY_MIN_V, min(BATTERY_MAX_V, voltage))
-        
-        # Piecewise linear approximation of LiPo discharge curve
-        # These breakpoints are based on typical 3S LiPo discharge characteristics
-        breakpoints = [
-            (9.0, 0),      # Empty
-            (9.6, 5),      # Critical low
-            (10.2, 15),    # Low
-            (10.5, 25),    # Start of nominal region
-            (10.8, 40),    
-            (11.1, 50),    # Nominal voltage
-            (11.4, 65),    
-            (11.7, 80),    # Good charge
-            (12.0, 90),    
-            (12.3, 95),    
-            (12.6, 100),   # Full
-        ]
-        
-        # Find the segment containing the voltage
-        for i in range(len(breakpoints) - 1):
-            v1, p1 = breakpoints[i]
-            v2, p2 = breakpoints[i + 1]
-            
-            if v1 <= voltage <= v2:
-                # Linear interpolation within segment
-                ratio = (voltage - v1) / (v2 - v1)
-                return p1 + ratio * (p2 - p1)
-        
-        # Fallback (shouldn't reach here due to clamping)
-        return 0 if voltage < BATTERY_MIN_V else 100
+        position = (voltage - BATTERY_MIN_V) * _BATTERY_LUT_SCALE
+        index = min(int(position), len(_BATTERY_LUT) - 2)
+        low = _BATTERY_LUT[index]
+        return low + (position - index) * (_BATTERY_LUT[index + 1] - low)
 
     def read_sensors(self) -> Dict[str, float]:
-        """Read sensor data from hardware or simulation."""
+        """
+        Read sensor data from hardware or simulation.
+        
+        Callers within HARDWARE_READ_TTL of the last read share its result
+        instead of touching the bus again.
+        """
+        read_at, cached = self._sensor_cache
+        now = time.monotonic()
+        if cached is not None and now - read_at < HARDWARE_READ_TTL:
+            return cached
+        
         sensors = {}
         
         if self.hardware_available and board:
             try:
-                # IMU Data (accelerometer and gyroscope)
+                # IMU Data (accelerometer and gyroscope); like get_battery()
+                # a non-blocking queue pop, so no _bus_lock
                 imu = board.get_imu()
                 if imu:
                     sensors["accelerometer_x"] = round(imu[0], 3)
@@ -869,7 +1395,8 @@ class TonyPiRobotClient:
             try:
                 # Ultrasonic distance sensor
                 if sonar:
-                    distance = sonar.getDistance()
+                    with self._bus_lock:
+                        distance = sonar.getDistance()
                     if distance != 99999:
                         sensors["ultrasonic_distance"] = distance / 10.0  # Convert to cm
             except Exception as e:
@@ -898,59 +1425,83 @@ class TonyPiRobotClient:
         sensors["light_status"] = "dark" if is_dark else "bright"
         
         self.sensors = sensors
+        self._sensor_cache = (now, sensors)
         return sensors
 
+    def _bulk_read_servos(self) -> Dict[int, Optional[Tuple[Any, Any, Any]]]:
+        """
+        Read (pulse, temp, vin) for every bus servo in one sweep.
+        
+        The bus lock is taken per servo, so head gestures and other bus
+        users get in between servos instead of waiting out the whole sweep.
+        A servo whose read raised maps to None.
+        """
+        readings = {}
+        for idx in range(1, self.SERVO_COUNT + 1):
+            try:
+                with self._bus_lock:
+                    readings[idx] = controller.get_bus_servo_status(idx)
+            except Exception as e:
+                logger.error(f"Error reading servo {idx}: {e}")
+                readings[idx] = None
+        return readings
+
     def get_servo_status(self) -> Dict[str, Any]:
         """
         Read real servo data from TonyPi hardware.
         Returns position, temperature, and voltage for each servo.
+        Results are reused for HARDWARE_READ_TTL like read_sensors().
         """
+        read_at, cached = self._servo_cache
+        now = time.monotonic()
+        if cached is not None and now - read_at < HARDWARE_READ_TTL:
+            return cached
+        
         servo_data = {}
-        servo_names = ["Left Hip", "Left Knee", "Right Hip", "Right Knee", "Head Pan", "Head Tilt"]
+        servo_names = self._STATUS_SERVO_NAMES
         
         if self.hardware_available and controller:
-            for idx in range(1, self.SERVO_COUNT + 1):
-                try:
-                    # Read servo data with timeout handling
-                    pos = controller.get_bus_servo_pulse(idx)
-                    temp = controller.get_bus_servo_temp(idx)
-                    vin = controller.get_bus_servo_vin(idx)
-                    
-                    # Convert pulse to degrees (500 = -90, 500 = center, 1000 = +90)
-                    # Standard formula: ((pulse - 500) / 500) * 90 degrees
-                    if pos is not None:
-                        angle = ((pos - 500) / 500) * 90
-                    else:
-                        angle = 0.0
-                    
-                    # Determine alert level based on temperature
-                    alert = "normal"
-                    if temp and temp > 70:
-                        alert = "critical"
-                    elif temp and temp > 60:
-                        alert = "warning"
-                    
-                    servo_data[f"servo_{idx}"] = {
-                        "id": idx,
-                        "name": servo_names[idx - 1] if idx <= len(servo_names) else f"Servo {idx}",
-                        "position": round(angle, 1),
-                        "temperature": temp if temp else 45.0,
-                        "voltage": (vin / 1000.0) if vin else 5.0,
-                        "torque_enabled": True,
-                        "alert_level": alert
-                    }
-                except Exception as e:
-                    logger.error(f"Error reading servo {idx}: {e}")
+            degrees_per_pulse = self._DEGREES_PER_PULSE
+            for idx, reading in self._bulk_read_servos().items():
+                name = servo_names[idx - 1] if idx <= len(servo_names) else f"Servo {idx}"
+                if reading is None:
                     # Provide default data on error
                     servo_data[f"servo_{idx}"] = {
                         "id": idx,
-                        "name": servo_names[idx - 1] if idx <= len(servo_names) else f"Servo {idx}",
+                        "name": name,
                         "position": 0.0,
                         "temperature": 45.0,
                         "voltage": 5.0,
                         "torque_enabled": True,
                         "alert_level": "normal"
                     }
+                    continue
+                
+                pos, temp, vin = reading
+                
+                # Convert pulse to degrees (500 = -90, 500 = center, 1000 = +90)
+                # Standard formula: ((pulse - 500) / 500) * 90 degrees
+                if pos is not None:
+                    angle = (pos - 500) * degrees_per_pulse
+                else:
+                    angle = 0.0
+                
+                # Determine alert level based on temperature
+                alert = "normal"
+                if temp and temp > 70:
+                    alert = "critical"
+                elif temp and temp > 60:
+                    alert = "warning"
+                
+                servo_data[f"servo_{idx}"] = {
+                    "id": idx,
+                    "name": name,
+                    "position": round(angle, 1),
+                    "temperature": temp if temp else 45.0,
+                    "voltage": (vin / 1000.0) if vin else 5.0,
+                    "torque_enabled": True,
+                    "alert_level": alert
+                }
         else:
             # Simulation mode
             for idx in range(1, self.SERVO_COUNT + 1):
@@ -966,24 +1517,24 @@ class TonyPiRobotClient:
                 }
         
         self.servo_data = servo_data
+        self._servo_cache = (now, servo_data)
         return servo_data
 
+    def _encode_telemetry(self, data: Dict[str, Any]) -> bytes:
+        """
+        Encode a telemetry payload with robot_id as its first key.
+        
+        The robot_id fragment is encoded once in __init__ and spliced in front
+        of the encoded fields, so `data` leaves it out and must not be empty.
+        """
+        body = _json_dumps(data)
+        if isinstance(body, str):
+            body = body.encode()
+        return self._robot_id_prefix + body[1:]
+
     def get_sensor_unit(self, sensor_name: str) -> str:
         """Get the unit for a sensor."""
-        unit_map = {
-            "accelerometer_x": "m/s^2",
-            "accelerometer_y": "m/s^2",
-            "accelerometer_z": "m/s^2",
-            "gyroscope_x": "deg/s",
-            "gyroscope_y": "deg/s",
-            "gyroscope_z": "deg/s",
-            "ultrasonic_distance": "cm",
-            "cpu_temperature": "C",
-            "light_sensor_dark": "bool",
-            "light_level": "%",
-            "light_status": "status"
-        }
-        return unit_map.get(sensor_name, "")
+        return _SENSOR_UNITS.get(sensor_name, "")
 
     def send_sensor_data(self):
         """Send sensor data to monitoring system."""
@@ -993,25 +1544,44 @@ class TonyPiRobotClient:
         
         try:
             sensors = self.read_sensors()
-            sent_count = 0
             
-            for sensor_name, value in sensors.items():
-                # Skip non-numeric values for certain sensors
-                if sensor_name == "light_status":
-                    continue  # This is a string, skip it
-                    
-                data = {
-                    "robot_id": self.robot_id,
-                    "sensor_type": sensor_name,
-                    "value": value,
-                    "timestamp": datetime.now().isoformat(),
-                    "unit": self.get_sensor_unit(sensor_name)
+            # One batched message per cycle of bare values; the backend knows
+            # each sensor's unit. light_status is a string label and is not
+            # stored as a reading
+            readings = {
+                sensor_name: value
+                for sensor_name, value in sensors.items()
+                if sensor_name != "light_status"
+            }
+            
+            # Only send readings that moved past their deadband since they
+            # were last published, unless the heartbeat interval has passed
+            now = time.monotonic()
+            published_at, last_readings = self._last_sensor_pub
+            if now - published_at >= self.TELEMETRY_HEARTBEAT:
+                published_at = now
+            else:
+                deadbands = self._SENSOR_DEADBANDS
+                readings = {
+                    sensor_name: value
+                    for sensor_name, value in readings.items()
+                    if sensor_name not in last_readings
+                    or (value != last_readings[sensor_name]
+                        and abs(value - last_readings[sensor_name]) >= deadbands.get(sensor_name, 0.0))
                 }
-                result = self.client.publish(self.topics["sensors"], json.dumps(data))
-                if result.rc == 0:
-                    sent_count += 1
+                if not readings:
+                    return
             
-            logger.info(f"Sent {sent_count}/{len(sensors)} sensor readings to {self.topics['sensors']}")
+            data = {
+                "readings": readings,
+                "timestamp": _iso_now()
+            }
+            result = self.client.publish(self.topics["sensors"], self._encode_telemetry(data))
+            if result.rc == 0:
+                self._last_sensor_pub = (published_at, {**last_readings, **readings})
+                logger.info("Sent %d sensor readings to %s", len(readings), self.topics["sensors"])
+            else:
+                logger.error(f"Failed to send sensor data: rc={result.rc}")
             
         except Exception as e:
             logger.error(f"Error sending sensor data: {e}")
@@ -1026,15 +1596,14 @@ class TonyPiRobotClient:
             servo_data = self.get_servo_status()
             
             data = {
-                "robot_id": self.robot_id,
                 "servos": servo_data,
                 "servo_count": len(servo_data),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _iso_now()
             }
             
-            result = self.client.publish(self.topics["servos"], json.dumps(data))
+            result = self.client.publish(self.topics["servos"], self._encode_telemetry(data))
             if result.rc == 0:
-                logger.info(f"Sent servo data: {len(servo_data)} servos to {self.topics['servos']}")
+                logger.info("Sent servo data: %d servos to %s", len(servo_data), self.topics["servos"])
             else:
                 logger.error(f"Failed to send servo data: rc={result.rc}")
             
@@ -1049,8 +1618,17 @@ class TonyPiRobotClient:
         try:
             battery = self.get_battery_percentage()
             
+            # Skip a reading that has not moved since the last publish,
+            # unless the heartbeat interval has passed
+            now = time.monotonic()
+            published_at, last_battery = self._last_battery_pub
+            if (last_battery is not None
+                    and abs(battery - last_battery) < self.BATTERY_PUBLISH_DELTA
+                    and now - published_at < self.TELEMETRY_HEARTBEAT):
+                return
+            
             # Use actual voltage if available, otherwise estimate from percentage
-            if hasattr(self, '_last_battery_voltage'):
+            if self._last_battery_voltage is not None:
                 voltage = self._last_battery_voltage
             else:
                 # Fallback: estimate voltage from percentage (for simulation mode)
@@ -1058,15 +1636,15 @@ class TonyPiRobotClient:
                 voltage = 9.0 + (battery / 100.0) * 3.6
             
             data = {
-                "robot_id": self.robot_id,
                 "percentage": round(battery, 1),
                 "voltage": round(voltage, 2),
                 "charging": False,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _iso_now()
             }
             
-            self.client.publish(self.topics["battery"], json.dumps(data))
-            logger.debug(f"Sent battery status: {battery:.1f}% ({voltage:.2f}V)")
+            self.client.publish(self.topics["battery"], self._encode_telemetry(data))
+            self._last_battery_pub = (now, battery)
+            logger.debug("Sent battery status: %.1f%% (%.2fV)", battery, voltage)
             
         except Exception as e:
             logger.error(f"Error sending battery status: {e}")
@@ -1077,25 +1655,36 @@ class TonyPiRobotClient:
             return
         
         try:
+            location = (self.location["x"], self.location["y"], self.location["z"])
+            
+            # Skip an unchanged position unless the heartbeat interval has passed
+            now = time.monotonic()
+            published_at, last_location = self._last_location_pub
+            if location == last_location and now - published_at < self.TELEMETRY_HEARTBEAT:
+                return
+            
             data = {
-                "robot_id": self.robot_id,
-                "x": self.location["x"],
-                "y": self.location["y"],
-                "z": self.location["z"],
-                "timestamp": datetime.now().isoformat()
+                "x": location[0],
+                "y": location[1],
+                "z": location[2],
+                "timestamp": _iso_now()
             }
             
-            self.client.publish(self.topics["location"], json.dumps(data))
-            logger.debug(f"Sent location: {self.location}")
+            self.client.publish(self.topics["location"], self._encode_telemetry(data))
+            self._last_location_pub = (now, location)
+            logger.debug("Sent location: %s", self.location)
             
         except Exception as e:
             logger.error(f"Error sending location: {e}")
 
-    def send_status_update(self):
-        """Send robot status update with full Task Manager metrics."""
+    def send_status_update(self) -> Optional[mqtt.MQTTMessageInfo]:
+        """
+        Send robot status update with full Task Manager metrics.
+        Returns the publish handle, or None if nothing was sent.
+        """
         if not self.is_connected:
             logger.warning("Not connected - skipping status update send")
-            return
+            return None
         
         try:
             ip_address = self.get_local_ip()
@@ -1106,9 +1695,8 @@ class TonyPiRobotClient:
             status = "emergency_stopped" if self.emergency_stopped else self.status
             
             data = {
-                "robot_id": self.robot_id,
                 "status": status,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_now(),
                 "system_info": system_info,
                 "hardware_available": self.hardware_available,
                 "ip_address": ip_address,
@@ -1117,14 +1705,18 @@ class TonyPiRobotClient:
                 "emergency_reason": self.emergency_reason
             }
             
-            result = self.client.publish(self.topics["status"], json.dumps(data))
+            result = self.client.publish(self.topics["status"], self._encode_telemetry(data))
             if result.rc == 0:
-                logger.info(f"Sent status to {self.topics['status']}: CPU={system_info.get('cpu_percent')}%, MEM={system_info.get('memory_percent')}%, TEMP={system_info.get('cpu_temperature')}°C")
+                logger.info("Sent status to %s: CPU=%s%%, MEM=%s%%, TEMP=%s°C", self.topics["status"],
+                            system_info.get('cpu_percent'), system_info.get('memory_percent'),
+                            system_info.get('cpu_temperature'))
             else:
                 logger.error(f"Failed to send status: rc={result.rc}")
+            return result
             
         except Exception as e:
             logger.error(f"Error sending status: {e}")
+            return None
 
     def send_vision_data(self, detection_result: Dict[str, Any]):
         """
@@ -1144,8 +1736,7 @@ class TonyPiRobotClient:
         
         try:
             data = {
-                "robot_id": self.robot_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_now(),
                 "detection": detection_result.get("detection"),
                 "label": detection_result.get("label"),
                 "confidence": detection_result.get("confidence"),
@@ -1158,8 +1749,8 @@ class TonyPiRobotClient:
                 "error": detection_result.get("error")
             }
             
-            self.client.publish(self.topics["vision"], json.dumps(data))
-            logger.debug(f"Sent vision data: {detection_result.get('label')} ({detection_result.get('confidence', 0):.2f})")
+            self.client.publish(self.topics["vision"], self._encode_telemetry(data))
+            logger.debug("Sent vision data: %s (%.2f)", detection_result.get('label'), detection_result.get('confidence', 0))
             
         except Exception as e:
             logger.error(f"Error sending vision data: {e}")
@@ -1178,14 +1769,13 @@ class TonyPiRobotClient:
         
         try:
             data = {
-                "robot_id": self.robot_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_now(),
                 "level": level.upper(),
                 "message": message,
                 "source": source
             }
             
-            self.client.publish(self.topics["logs"], json.dumps(data))
+            self.client.publish(self.topics["logs"], self._encode_telemetry(data))
             
         except Exception as e:
             logger.error(f"Error sending log message: {e}")
@@ -1223,8 +1813,7 @@ class TonyPiRobotClient:
         
         try:
             data = {
-                "robot_id": self.robot_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_now(),
                 "task_name": task_name,
                 "status": status,
             }
@@ -1251,8 +1840,8 @@ class TonyPiRobotClient:
             if items_done is not None and items_total is not None and items_total > 0:
                 data["progress_percent"] = round((items_done / items_total) * 100, 1)
             
-            self.client.publish(self.job_topic, json.dumps(data))
-            logger.debug(f"Sent job event: {task_name} - {status}")
+            self.client.publish(self.job_topic, self._encode_telemetry(data))
+            logger.debug("Sent job event: %s - %s", task_name, status)
             
         except Exception as e:
             logger.error(f"Error sending job event: {e}")
@@ -1271,15 +1860,14 @@ class TonyPiRobotClient:
         
         try:
             data = {
-                "robot_id": self.robot_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_now(),
                 "qr_data": qr_data,
                 "station_name": station_name,
                 "action": action or "scanned"
             }
             
-            self.client.publish(self.scan_topic, json.dumps(data))
-            logger.debug(f"Sent QR scan: {qr_data}")
+            self.client.publish(self.scan_topic, self._encode_telemetry(data))
+            logger.debug("Sent QR scan: %s", qr_data)
             
         except Exception as e:
             logger.error(f"Error sending QR scan: {e}")
@@ -1292,6 +1880,8 @@ class TonyPiRobotClient:
         """Start the MJPEG camera streaming server."""
         try:
             self._camera_server = ThreadedHTTPServer(('', self.camera_port), MJPEGHandler)
+            self._camera_server.stream_width = self.stream_width
+            self._camera_server.stream_quality = self.stream_quality
             self._camera_thread = threading.Thread(target=self._camera_server.serve_forever, daemon=True)
             self._camera_thread.start()
             logger.info(f"📹 Camera stream started: http://{self._ip_address}:{self.camera_port}/?action=stream")
@@ -1320,11 +1910,35 @@ class TonyPiRobotClient:
         Args:
             frame: OpenCV frame (numpy array) from camera
         """
-        global _current_frame, _frame_lock
-        
         if frame is not None:
-            with _frame_lock:
-                _current_frame = frame.copy() if hasattr(frame, 'copy') else frame
+            if not CV2_AVAILABLE:
+                # numpy arrives with cv2; without it frames only feed /status
+                _frame_slot.append(frame.copy())
+                return
+            
+            buffers = self._frame_buffers
+            views = self._frame_views
+            if not buffers or buffers[0].shape != frame.shape or buffers[0].dtype != frame.dtype:
+                # First frame or camera resolution change
+                buffers[:] = [np.empty_like(frame) for _ in range(FRAME_BUFFER_COUNT)]
+                views[:] = [None] * FRAME_BUFFER_COUNT
+            
+            # Copy into the next buffer and publish a fresh view of it: no
+            # per-frame allocation, and the new view object still gives
+            # readers and the encode caches a distinct identity per frame.
+            idx = self._frame_write_idx = (self._frame_write_idx + 1) % FRAME_BUFFER_COUNT
+            published = views[idx]
+            if published is not None and published() is not None:
+                # Someone still holds the frame last published from this
+                # buffer; leave it to them and copy into a new buffer
+                buffers[idx] = np.empty_like(frame)
+            target = buffers[idx]
+            np.copyto(target, frame)
+            view = target.view()
+            views[idx] = weakref.ref(view)
+            _frame_slot.append(view)
+            with _frame_cv:
+                _frame_cv.notify_all()
 
     @property
     def camera_url(self) -> str:
@@ -1383,9 +1997,24 @@ class TonyPiRobotClient:
             self.emergency_reason = None
 
     async def connect(self):
-        """Connect to MQTT broker."""
+        """
+        Connect to MQTT broker.
+        
+        A broker that is unreachable (restarting, network not up yet) is
+        retried CONNECT_ATTEMPTS times with capped, jittered exponential
+        backoff before giving up.
+        """
         try:
-            self.client.connect(self.mqtt_broker, self.mqtt_port, 60)
+            for attempt in range(self.CONNECT_ATTEMPTS):
+                try:
+                    self.client.connect(self.mqtt_broker, self.mqtt_port, 60)
+                    break
+                except OSError as e:
+                    if attempt == self.CONNECT_ATTEMPTS - 1:
+                        raise
+                    delay = min(self.RECONNECT_DELAY_MAX, 2 ** attempt) * random.uniform(0.8, 1.2)
+                    logger.warning("Broker unreachable (%s), retrying in %.1fs", e, delay)
+                    await asyncio.sleep(delay)
             self.client.loop_start()
             
             # Wait for connection
@@ -1407,20 +2036,107 @@ class TonyPiRobotClient:
         """Disconnect from MQTT broker."""
         if self.is_connected:
             self.status = "offline"
-            self.send_status_update()
-            await asyncio.sleep(1)
+            result = self.send_status_update()
+            if result is not None:
+                # Wait until the offline status is actually written out
+                # (bounded), instead of sleeping a fixed second
+                loop = asyncio.get_running_loop()
+                try:
+                    await loop.run_in_executor(None, functools.partial(result.wait_for_publish, timeout=2.0))
+                except (RuntimeError, ValueError) as e:
+                    logger.warning(f"Offline status not flushed: {e}")
+        
+        # Stop delivering commands before the workers they submit to go away
+        self.client.loop_stop()
         
         # Stop camera server
         self._stop_camera_server()
         
+        # Let any running head gesture finish; drop queued ones
+        self._servo_worker.shutdown(wait=False, cancel_futures=True)
+        # Drop queued telemetry and wait for an in-flight read to finish
+        # before the thermal fd below is closed under it
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self._io_pool.shutdown, wait=True, cancel_futures=True))
+        
         # Cleanup light sensor GPIO
-        if hasattr(self, 'light_sensor'):
-            self.light_sensor.cleanup()
+        self.light_sensor.cleanup()
+        
+        # Release the thermal sysfs handle; later reads fall back to simulation
+        thermal_fd, self._thermal_fd = self._thermal_fd, None
+        if thermal_fd is not None:
+            os.close(thermal_fd)
             
-        self.client.loop_stop()
         self.client.disconnect()
         logger.info("Disconnected from MQTT broker")
 
+    async def _offload(self, func: Callable, *args):
+        """Run a blocking hardware read/send on the telemetry worker."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, func, *args)
+
+    async def _scheduler(self):
+        """
+        Drive every telemetry cadence from one fixed-step timer.
+        
+        Each channel runs on the ticks that are multiples of its period, so
+        channels due together publish back to back in a single wakeup.
+        Ticks are skipped while MQTT is disconnected, and ticks missed while
+        the loop was stalled are dropped rather than replayed.
+        """
+        schedule = [(period, getattr(self, name)) for period, name in self._TELEMETRY_SCHEDULE]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        tick = 0
+        while self.running:
+            deadline += self.TELEMETRY_TICK
+            now = loop.time()
+            if now - deadline > self.TELEMETRY_TICK:
+                deadline = now
+            await asyncio.sleep(max(0.0, deadline - now))
+            tick += 1
+            if not self.is_connected:
+                continue
+            for period, channel_tick in schedule:
+                if tick % period:
+                    continue
+                try:
+                    await channel_tick()
+                except Exception as loop_error:
+                    logger.error(f"Error in telemetry loop: {loop_error}")
+                    print(f"⚠️  Loop error: {loop_error}")
+                    sys.stdout.flush()
+
+    async def _sensor_tick(self):
+        await self._offload(self.send_sensor_data)
+        sensors = self.sensors
+        cpu_temp = sensors.get('cpu_temperature', 0)
+        print(f"📊 Sensors: CPU={cpu_temp:.1f}°C, Accel=({sensors.get('accelerometer_x', 0):.2f}, {sensors.get('accelerometer_y', 0):.2f}, {sensors.get('accelerometer_z', 0):.2f})")
+        sys.stdout.flush()
+
+    async def _servo_tick(self):
+        await self._offload(self.send_servo_data)
+        print(f"🔧 Servos: {len(self.servo_data)} servos sent")
+        sys.stdout.flush()
+
+    async def _battery_tick(self):
+        await self._offload(self.send_battery_status)
+        print(f"🔋 Battery: {self.battery_level:.1f}%")
+        sys.stdout.flush()
+
+    async def _location_tick(self):
+        self.send_location_update()
+
+    async def _status_tick(self):
+        await self._offload(self.send_status_update)
+        sys_info = self.get_system_info()
+        print(f"💻 Status: CPU={sys_info.get('cpu_percent', 0):.1f}%, MEM={sys_info.get('memory_percent', 0):.1f}%, DISK={sys_info.get('disk_usage', 0):.1f}%, TEMP={sys_info.get('cpu_temperature', 0):.1f}°C")
+        sys.stdout.flush()
+
+    async def _log_tick(self):
+        self._log_cycles += 1
+        self.send_log_message("INFO", f"Robot running normally. Cycle: {self._log_cycles}", "telemetry")
+
     async def run(self):
         """Main loop for the robot client."""
         self.running = True
@@ -1443,9 +2159,9 @@ class TonyPiRobotClient:
             # Send initial data immediately
             print("\n📡 Sending initial telemetry...")
             self.send_status_update()
-            self.send_battery_status()
-            self.send_sensor_data()
-            self.send_servo_data()
+            await self._offload(self.send_battery_status)
+            await self._offload(self.send_sensor_data)
+            await self._offload(self.send_servo_data)
             self.send_location_update()
             self.send_log_message("INFO", "Robot client started and connected", "main")
             print("✅ Initial telemetry sent!")
@@ -1454,7 +2170,7 @@ class TonyPiRobotClient:
             print("✅ ROBOT CLIENT RUNNING - Sending telemetry data")
             print("=" * 60)
             print("Data being sent:")
-            print("  • Sensors:  every 2 seconds (IMU, temp, light, ultrasonic)")
+            print("  • Sensors:  checked every 2 seconds, sent on change (all every 60 s)")
             print("  • Servos:   every 3 seconds (position, temp, voltage)")
             print("  • Status:   every 10 seconds (CPU, memory, disk, uptime)")
             print("  • Battery:  every 30 seconds")
@@ -1463,82 +2179,24 @@ class TonyPiRobotClient:
             print("=" * 60)
             print("\nPress Ctrl+C to stop\n")
             
-            last_sensor_time = 0
-            last_servo_time = 0
-            last_battery_time = 0
-            last_location_time = 0
-            last_status_time = 0
-            last_log_time = 0
-            cycle_count = 0
-            
-            while self.running:
-                try:
-                    current_time = time.time()
-                    cycle_count += 1
-                    
-                    # Check MQTT connection status
-                    if not self.is_connected:
-                        print("⚠️  MQTT disconnected, attempting reconnect...")
-                        sys.stdout.flush()
-                        try:
-                            self.client.reconnect()
-                            await asyncio.sleep(2)
-                        except Exception as e:
-                            logger.error(f"Reconnect failed: {e}")
-                            await asyncio.sleep(5)
-                            continue
-                    
-                    # Send sensor data every 2 seconds
-                    if current_time - last_sensor_time >= 2:
-                        self.send_sensor_data()
-                        sensors = self.sensors
-                        cpu_temp = sensors.get('cpu_temperature', 0)
-                        print(f"📊 Sensors: CPU={cpu_temp:.1f}°C, Accel=({sensors.get('accelerometer_x', 0):.2f}, {sensors.get('accelerometer_y', 0):.2f}, {sensors.get('accelerometer_z', 0):.2f})")
-                        sys.stdout.flush()
-                        last_sensor_time = current_time
-                    
-                    # Send servo data every 3 seconds
-                    if current_time - last_servo_time >= 3:
-                        self.send_servo_data()
-                        print(f"🔧 Servos: {len(self.servo_data)} servos sent")
+            scheduler = asyncio.create_task(self._scheduler())
+            try:
+                # Connection watchdog; telemetry runs in the scheduler task.
+                # paho's network thread reconnects on its own with the
+                # reconnect_delay_set() backoff, so this only reports outages.
+                was_connected = True
+                while self.running:
+                    if was_connected and not self.is_connected:
+                        print("⚠️  MQTT disconnected, waiting for reconnect...")
                         sys.stdout.flush()
-                        last_servo_time = current_time
-                    
-                    # Send battery status every 30 seconds
-                    if current_time - last_battery_time >= 30:
-                        self.send_battery_status()
-                        print(f"🔋 Battery: {self.battery_level:.1f}%")
+                    elif not was_connected and self.is_connected:
+                        print("✅ MQTT reconnected")
                         sys.stdout.flush()
-                        last_battery_time = current_time
-                    
-                    # Send location every 5 seconds
-                    if current_time - last_location_time >= 5:
-                        self.send_location_update()
-                        last_location_time = current_time
-                    
-                    # Send status every 10 seconds (more frequent for Task Manager)
-                    if current_time - last_status_time >= 10:
-                        self.send_status_update()
-                        sys_info = self.get_system_info()
-                        print(f"💻 Status: CPU={sys_info.get('cpu_percent', 0):.1f}%, MEM={sys_info.get('memory_percent', 0):.1f}%, DISK={sys_info.get('disk_usage', 0):.1f}%, TEMP={sys_info.get('cpu_temperature', 0):.1f}°C")
-                        sys.stdout.flush()
-                        last_status_time = current_time
-                    
-                    # Send periodic log message every 30 seconds
-                    if current_time - last_log_time >= 30:
-                        self.send_log_message("INFO", f"Robot running normally. Cycle: {cycle_count}", "telemetry")
-                        last_log_time = current_time
-                    
-                    # Simulate battery drain (very slow)
-                    if not self.hardware_available and self.battery_level > 0:
-                        self.battery_level = max(0, self.battery_level - 0.001)
-                    
-                except Exception as loop_error:
-                    logger.error(f"Error in telemetry loop: {loop_error}")
-                    print(f"⚠️  Loop error: {loop_error}")
-                    sys.stdout.flush()
-                
-                await asyncio.sleep(0.1)
+                    was_connected = self.is_connected
+                    await asyncio.sleep(1)
+            finally:
+                scheduler.cancel()
+                await asyncio.gather(scheduler, return_exceptions=True)
                 
         except KeyboardInterrupt:
             print("\n🛑 Stopping robot client...")
@@ -1596,7 +2254,10 @@ Environment Variables:
     )
     
     try:
-        asyncio.run(robot.run())
+        if UVLOOP_AVAILABLE:
+            uvloop.run(robot.run())
+        else:
+            asyncio.run(robot.run())
     except KeyboardInterrupt:
         print("\n👋 Robot client stopped by user")
     except Exception as e: